@@ -41,13 +41,13 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
         async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{constants.REST_URL}/public/get-ticker")
-            resp_json = await resp.json()
-            for t_pair in trading_pairs:
-                last_trade = [o["a"] for o in resp_json["result"]["data"] if o["i"] ==
-                              crypto_com_utils.convert_to_exchange_trading_pair(t_pair)]
-                if last_trade and last_trade[0] is not None:
-                    result[t_pair] = last_trade[0]
+            async with client.get(f"{constants.REST_URL}/public/get-ticker") as resp:
+                resp_json = await resp.json()
+        last_trades: Dict[str, Any] = {ticker["i"]: ticker["a"] for ticker in resp_json["result"]["data"]}
+        for t_pair in trading_pairs:
+            last_trade = last_trades.get(crypto_com_utils.convert_to_exchange_trading_pair(t_pair))
+            if last_trade is not None:
+                result[t_pair] = last_trade
         return result
 
     @staticmethod
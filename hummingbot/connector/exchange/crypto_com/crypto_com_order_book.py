@@ -16,6 +16,10 @@ from hummingbot.core.data_type.order_book_message import (
 from hummingbot.connector.exchange.crypto_com.crypto_com_order_book_message import CryptoComOrderBookMessage
 
 _logger = None
+_SNAPSHOT = OrderBookMessageType.SNAPSHOT
+_DIFF = OrderBookMessageType.DIFF
+_TRADE = OrderBookMessageType.TRADE
+_EMPTY: Dict[str, Any] = {}
 
 
 class CryptoComOrderBook(OrderBook):
@@ -30,7 +34,7 @@ class CryptoComOrderBook(OrderBook):
     def snapshot_message_from_exchange(cls,
                                        msg: Dict[str, any],
                                        timestamp: float,
-                                       metadata: Optional[Dict] = None):
+                                       metadata: Dict[str, Any] = _EMPTY):
         """
         Convert json snapshot data into standard OrderBookMessage format
         :param msg: json snapshot data from live web socket stream
@@ -38,12 +42,9 @@ class CryptoComOrderBook(OrderBook):
         :return: CryptoComOrderBookMessage
         """
 
-        if metadata:
-            msg.update(metadata)
-
         return CryptoComOrderBookMessage(
-            message_type=OrderBookMessageType.SNAPSHOT,
-            content=msg,
+            message_type=_SNAPSHOT,
+            content={**msg, **metadata},
             timestamp=timestamp
         )
 
@@ -56,7 +57,7 @@ class CryptoComOrderBook(OrderBook):
         :return: CryptoComOrderBookMessage
         """
         return CryptoComOrderBookMessage(
-            message_type=OrderBookMessageType.SNAPSHOT,
+            message_type=_SNAPSHOT,
             content=record.json,
             timestamp=record.timestamp
         )
@@ -65,7 +66,7 @@ class CryptoComOrderBook(OrderBook):
     def diff_message_from_exchange(cls,
                                    msg: Dict[str, any],
                                    timestamp: Optional[float] = None,
-                                   metadata: Optional[Dict] = None):
+                                   metadata: Dict[str, Any] = _EMPTY):
         """
         Convert json diff data into standard OrderBookMessage format
         :param msg: json diff data from live web socket stream
@@ -73,12 +74,9 @@ class CryptoComOrderBook(OrderBook):
         :return: CryptoComOrderBookMessage
         """
 
-        if metadata:
-            msg.update(metadata)
-
         return CryptoComOrderBookMessage(
-            message_type=OrderBookMessageType.DIFF,
-            content=msg,
+            message_type=_DIFF,
+            content={**msg, **metadata},
             timestamp=timestamp
         )
 
@@ -91,7 +89,7 @@ class CryptoComOrderBook(OrderBook):
         :return: CryptoComOrderBookMessage
         """
         return CryptoComOrderBookMessage(
-            message_type=OrderBookMessageType.DIFF,
+            message_type=_DIFF,
             content=record.json,
             timestamp=record.timestamp
         )
@@ -100,26 +98,25 @@ class CryptoComOrderBook(OrderBook):
     def trade_message_from_exchange(cls,
                                     msg: Dict[str, Any],
                                     timestamp: Optional[float] = None,
-                                    metadata: Optional[Dict] = None):
+                                    metadata: Dict[str, Any] = _EMPTY):
         """
         Convert a trade data into standard OrderBookMessage format
         :param record: a trade data from the database
         :return: CryptoComOrderBookMessage
         """
 
-        if metadata:
-            msg.update(metadata)
-
-        msg.update({
+        content = {
+            **msg,
+            **metadata,
             "exchange_order_id": msg.get("d"),
             "trade_type": msg.get("s"),
             "price": msg.get("p"),
             "amount": msg.get("q"),
-        })
+        }
 
         return CryptoComOrderBookMessage(
-            message_type=OrderBookMessageType.TRADE,
-            content=msg,
+            message_type=_TRADE,
+            content=content,
             timestamp=timestamp
         )
 
@@ -132,7 +129,7 @@ class CryptoComOrderBook(OrderBook):
         :return: CryptoComOrderBookMessage
         """
         return CryptoComOrderBookMessage(
-            message_type=OrderBookMessageType.TRADE,
+            message_type=_TRADE,
             content=record.json,
             timestamp=record.timestamp
         )
@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 
+import numpy as np
+
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -12,6 +16,18 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessageType,
 )
 
+s_empty_column = np.ndarray(shape=(0,), dtype="float64")
+
+
+def _decode_levels(levels: List[List[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decode [price, amount, count] order book levels into parallel price and amount columns in one pass
+    """
+    if len(levels) == 0:
+        return s_empty_column, s_empty_column
+    decoded: np.ndarray = np.asarray(levels, dtype="float64")
+    return decoded[:, 0], decoded[:, 1]
+
 
 class CryptoComOrderBookMessage(OrderBookMessage):
     def __new__(
@@ -53,18 +69,18 @@ class CryptoComOrderBookMessage(OrderBookMessage):
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        asks = map(self.content["asks"], lambda ask: {"price": ask[0], "amount": ask[1]})
-
+        prices, amounts = _decode_levels(self.content["asks"])
+        update_id = self.update_id
         return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount in asks
+            OrderBookRow(price, amount, update_id) for price, amount in zip(prices.tolist(), amounts.tolist())
         ]
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        bids = map(self.content["bids"], lambda bid: {"price": bid[0], "amount": bid[1]})
-
+        prices, amounts = _decode_levels(self.content["bids"])
+        update_id = self.update_id
         return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount in bids
+            OrderBookRow(price, amount, update_id) for price, amount in zip(prices.tolist(), amounts.tolist())
         ]
 
     def __eq__(self, other) -> bool:
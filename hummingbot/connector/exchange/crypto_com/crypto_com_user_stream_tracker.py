@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from functools import cached_property
 from typing import (
     Optional,
     List,
@@ -37,22 +38,20 @@ class CryptoComUserStreamTracker(UserStreamTracker):
         self._crypto_com_auth: CryptoComAuth = crypto_com_auth
         self._trading_pairs: List[str] = trading_pairs
         self._ev_loop: asyncio.events.AbstractEventLoop = asyncio.get_event_loop()
-        self._data_source: Optional[UserStreamTrackerDataSource] = None
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
 
-    @property
+    @cached_property
     def data_source(self) -> UserStreamTrackerDataSource:
         """
         *required
         Initializes a user stream data source (user specific order diffs from live socket stream)
+        on first access; later accesses are a plain instance attribute read.
         :return: OrderBookTrackerDataSource
         """
-        if not self._data_source:
-            self._data_source = CryptoComAPIUserStreamDataSource(
-                crypto_com_auth=self._crypto_com_auth,
-                trading_pairs=self._trading_pairs
-            )
-        return self._data_source
+        return CryptoComAPIUserStreamDataSource(
+            crypto_com_auth=self._crypto_com_auth,
+            trading_pairs=self._trading_pairs
+        )
 
     @property
     def exchange_name(self) -> str:
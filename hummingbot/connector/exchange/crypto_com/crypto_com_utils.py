@@ -67,7 +67,7 @@ def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
 
 def get_new_client_order_id(is_buy: bool, trading_pair: str) -> str:
     side = "B" if is_buy else "S"
-    return f"{HBOT_BROKER_ID}{side}-{trading_pair}-{get_tracking_nonce()}"
+    return "".join((HBOT_BROKER_ID, side, "-", trading_pair, "-", str(get_tracking_nonce())))
 
 
 def get_api_reason(code: str) -> str:
@@ -65,7 +65,7 @@ class CryptoComWebsocket(RequestId):
                 try:
                     raw_msg_str: str = await asyncio.wait_for(self._client.recv(), timeout=self.MESSAGE_TIMEOUT)
                     raw_msg = ujson.loads(raw_msg_str)
-                    if "method" in raw_msg and raw_msg["method"] == "public/heartbeat":
+                    if raw_msg.get("method") == "public/heartbeat":
                         payload = {"id": raw_msg["id"], "method": "public/respond-heartbeat"}
                         safe_ensure_future(self._client.send(ujson.dumps(payload)))
                     yield raw_msg
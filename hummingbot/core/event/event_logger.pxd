@@ -6,5 +6,4 @@ cdef class EventLogger(EventListener):
         str _event_source
         object _logged_events
         dict _waiting
-        dict _wait_returns
     cdef c_call(self, object event_object)
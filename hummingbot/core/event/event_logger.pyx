@@ -16,7 +16,6 @@ cdef class EventLogger(EventListener):
         self._event_source = event_source
         self._logged_events = []
         self._waiting = {}
-        self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
@@ -30,16 +29,14 @@ cdef class EventLogger(EventListener):
         self._logged_events.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
-        notifier = asyncio.Event()
-        self._waiting[notifier] = event_type
+        future = asyncio.get_event_loop().create_future()
+        self._waiting[future] = event_type
 
-        async with timeout(timeout_seconds):
-            await notifier.wait()
-
-        retval = self._wait_returns.get(notifier)
-        if notifier in self._wait_returns:
-            del self._wait_returns[notifier]
-        return retval
+        try:
+            async with timeout(timeout_seconds):
+                return await future
+        finally:
+            self._waiting.pop(future, None)
 
     def __call__(self, event_object):
         self.c_call(event_object)
@@ -48,10 +45,6 @@ cdef class EventLogger(EventListener):
         self._logged_events.append(event_object)
         event_object_type = type(event_object)
 
-        should_notify = []
-        for notifier, waiting_event_type in self._waiting.items():
-            if event_object_type is waiting_event_type:
-                should_notify.append(notifier)
-                self._wait_returns[notifier] = event_object
-        for notifier in should_notify:
-            notifier.set()
+        for future, waiting_event_type in self._waiting.items():
+            if event_object_type is waiting_event_type and not future.done():
+                future.set_result(event_object)
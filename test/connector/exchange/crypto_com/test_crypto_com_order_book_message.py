@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
+import unittest
+
+from hummingbot.connector.exchange.crypto_com.crypto_com_order_book_message import CryptoComOrderBookMessage
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class CryptoComOrderBookMessageUnitTest(unittest.TestCase):
+    timestamp: float = 1609459200.5
+    update_id: int = 1609459200500
+
+    def snapshot_message(self, bids, asks) -> CryptoComOrderBookMessage:
+        return CryptoComOrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "ETH-USDT", "bids": bids, "asks": asks},
+            timestamp=self.timestamp
+        )
+
+    def test_levels_decode_to_order_book_rows(self):
+        message = self.snapshot_message(
+            bids=[["730.12", "1.5", "2"], ["729.80", "0.25", "1"]],
+            asks=[["730.50", "3", "4"], ["731.00", "0.001", "1"]],
+        )
+        self.assertEqual(self.update_id, message.update_id)
+        self.assertEqual([OrderBookRow(730.12, 1.5, self.update_id), OrderBookRow(729.80, 0.25, self.update_id)],
+                         message.bids)
+        self.assertEqual([OrderBookRow(730.50, 3.0, self.update_id), OrderBookRow(731.00, 0.001, self.update_id)],
+                         message.asks)
+
+    def test_empty_side_returns_no_rows(self):
+        message = self.snapshot_message(bids=[], asks=[["730.50", "3", "4"]])
+        self.assertEqual([], message.bids)
+        self.assertEqual([OrderBookRow(730.50, 3.0, self.update_id)], message.asks)
+
+
+if __name__ == "__main__":
+    unittest.main()
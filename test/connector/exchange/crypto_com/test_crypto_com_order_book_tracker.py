@@ -1,18 +1,20 @@
 #!/usr/bin/env python
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../../../")))
-import math
-import time
 import asyncio
 import logging
+import numpy as np
 import unittest
 from typing import Dict, Optional, List
 from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent, TradeType
 from hummingbot.connector.exchange.crypto_com.crypto_com_order_book_tracker import CryptoComOrderBookTracker
-from hummingbot.connector.exchange.crypto_com.crypto_com_api_order_book_data_source import CryptoComAPIOrderBookDataSource
 from hummingbot.core.data_type.order_book import OrderBook
 
+# 2021-01-01T00:00:00Z
+EPOCH_2021 = 1609459200.0
+
 
 class CryptoComOrderBookTrackerUnitTest(unittest.TestCase):
     order_book_tracker: Optional[CryptoComOrderBookTracker] = None
@@ -31,33 +33,55 @@ class CryptoComOrderBookTrackerUnitTest(unittest.TestCase):
         cls.order_book_tracker.start()
         cls.ev_loop.run_until_complete(cls.wait_til_tracker_ready())
 
+    @classmethod
+    def tearDownClass(cls):
+        # stop() drops the tracker's task references, so collect them first and wait for the cancelled tasks (and the
+        # websocket disconnects in their finally blocks) to finish before the loop is reused by other tests.
+        tracker_tasks: List[asyncio.Task] = [value for value in vars(cls.order_book_tracker).values()
+                                             if isinstance(value, asyncio.Task)]
+        tracker_tasks.extend(cls.order_book_tracker._tracking_tasks.values())
+        cls.order_book_tracker.stop()
+        cls.ev_loop.run_until_complete(asyncio.gather(*tracker_tasks, return_exceptions=True))
+
     @classmethod
     async def wait_til_tracker_ready(cls):
-        while True:
-            if len(cls.order_book_tracker.order_books) > 0:
-                print("Initialized real-time order books.")
-                return
-            await asyncio.sleep(1)
+        await cls.order_book_tracker._order_books_initialized.wait()
+        print("Initialized real-time order books.")
 
     async def run_parallel_async(self, *tasks, timeout=None):
-        future: asyncio.Future = asyncio.ensure_future(asyncio.gather(*tasks))
-        timer = 0
-        while not future.done():
-            if timeout and timer > timeout:
-                raise Exception("Timeout running parallel async tasks in tests")
-            timer += 1
-            now = time.time()
-            _next_iteration = now // 1.0 + 1  # noqa: F841
-            await asyncio.sleep(1.0)
-        return future.result()
+        return await asyncio.wait_for(safe_gather(*tasks), timeout)
 
     def run_parallel(self, *tasks):
         return self.ev_loop.run_until_complete(self.run_parallel_async(*tasks))
 
+    @staticmethod
+    async def wait_for_snapshots(order_book: OrderBook, count: int, timeout: float):
+        """
+        Wait until count more snapshots have been applied to order_book, raising asyncio.TimeoutError after timeout
+        seconds
+        """
+        snapshots_applied = asyncio.Event()
+        apply_snapshot = order_book.apply_snapshot
+        remaining: int = count
+
+        def counting_apply_snapshot(*args, **kwargs):
+            nonlocal remaining
+            apply_snapshot(*args, **kwargs)
+            remaining -= 1
+            if remaining <= 0:
+                snapshots_applied.set()
+
+        order_book.apply_snapshot = counting_apply_snapshot
+        try:
+            await asyncio.wait_for(snapshots_applied.wait(), timeout)
+        finally:
+            del order_book.apply_snapshot
+
     def setUp(self):
         self.event_logger = EventLogger()
+        order_books = tuple(self.order_book_tracker.order_books.items())
         for event_tag in self.events:
-            for trading_pair, order_book in self.order_book_tracker.order_books.items():
+            for trading_pair, order_book in order_books:
                 order_book.add_listener(event_tag, self.event_logger)
 
     def test_order_book_trade_event_emission(self):
@@ -66,23 +90,32 @@ class CryptoComOrderBookTrackerUnitTest(unittest.TestCase):
         trade events after correctly parsing the trade messages
         """
         self.run_parallel(self.event_logger.wait_for(OrderBookTradeEvent))
-        for ob_trade_event in self.event_logger.event_log:
-            self.assertTrue(type(ob_trade_event) == OrderBookTradeEvent)
-            self.assertTrue(ob_trade_event.trading_pair in self.trading_pairs)
-            self.assertTrue(type(ob_trade_event.timestamp) in [float, int])
-            self.assertTrue(type(ob_trade_event.amount) == float)
-            self.assertTrue(type(ob_trade_event.price) == float)
-            self.assertTrue(type(ob_trade_event.type) == TradeType)
-            # datetime is in seconds
-            self.assertTrue(math.ceil(math.log10(ob_trade_event.timestamp)) == 10)
-            self.assertTrue(ob_trade_event.amount > 0)
-            self.assertTrue(ob_trade_event.price > 0)
+        event_log: List[OrderBookTradeEvent] = self.event_logger.event_log
+        assertIn = self.assertIn
+        assertIsInstance = self.assertIsInstance
+        for ob_trade_event in event_log:
+            assertIsInstance(ob_trade_event, OrderBookTradeEvent)
+            assertIn(ob_trade_event.trading_pair, self.trading_pairs)
+            assertIsInstance(ob_trade_event.timestamp, (float, int))
+            assertIsInstance(ob_trade_event.amount, float)
+            assertIsInstance(ob_trade_event.price, float)
+            assertIsInstance(ob_trade_event.type, TradeType)
+
+        count: int = len(event_log)
+        timestamps: np.ndarray = np.fromiter((e.timestamp for e in event_log), dtype="float64", count=count)
+        amounts: np.ndarray = np.fromiter((e.amount for e in event_log), dtype="float64", count=count)
+        prices: np.ndarray = np.fromiter((e.price for e in event_log), dtype="float64", count=count)
+        # datetime is in seconds
+        self.assertGreaterEqual(timestamps.min(), EPOCH_2021)
+        np.testing.assert_array_less(timestamps, 1e10)
+        np.testing.assert_array_less(0, amounts)
+        np.testing.assert_array_less(0, prices)
 
     def test_tracker_integrity(self):
-        # Wait 5 seconds to process some diffs.
-        self.ev_loop.run_until_complete(asyncio.sleep(10.0))
         order_books: Dict[str, OrderBook] = self.order_book_tracker.order_books
         eth_usdt: OrderBook = order_books["ETH-USDT"]
+        # Crypto.com streams full order book snapshots instead of diffs, so wait for a few fresh ones to be applied.
+        self.ev_loop.run_until_complete(self.wait_for_snapshots(eth_usdt, 5, 10.0))
         self.assertIsNot(eth_usdt.last_diff_uid, 0)
         self.assertGreaterEqual(eth_usdt.get_price_for_volume(True, 10).result_price,
                                 eth_usdt.get_price(True))
@@ -91,9 +124,9 @@ class CryptoComOrderBookTrackerUnitTest(unittest.TestCase):
 
     def test_api_get_last_traded_prices(self):
         prices = self.ev_loop.run_until_complete(
-            CryptoComAPIOrderBookDataSource.get_last_traded_prices(["BTC-USDT", "LTC-BTC"]))
+            self.order_book_tracker.data_source.get_last_traded_prices(["BTC-USDT", "LTC-BTC"]))
         for key, value in prices.items():
-            print(f"{key} last_trade_price: {value}")
+            logging.debug("%s last_trade_price: %s", key, value)
         self.assertGreater(prices["BTC-USDT"], 1000)
         self.assertLess(prices["LTC-BTC"], 1)
 
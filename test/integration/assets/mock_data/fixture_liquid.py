@@ -1,4 +1,14 @@
-import json
+import ujson
+from types import MappingProxyType
+from typing import Dict
+
+
+def _frozen_snapshot(snapshot):
+    # Read-only view with [price, amount] levels as tuples, so code under test cannot mutate shared fixtures
+    return MappingProxyType({
+        side: tuple(tuple(level) for level in levels)
+        for side, levels in snapshot.items()
+    })
 
 
 class FixtureLiquid:
@@ -239,7 +249,7 @@ class FixtureLiquid:
     ]
 
     # Sample snapshot for trading pair LCXBTC with id = 538
-    SNAPSHOT_1 = {
+    SNAPSHOT_1 = _frozen_snapshot({
         'buy_price_levels': [
             ['0.00000002', '1000.00000000'],  # [price, amount]
             ['0.00000001', '731578.70194909']
@@ -266,10 +276,10 @@ class FixtureLiquid:
             ['0.00000477', '1500000.00000000'],
             ['0.00000585', '2333.00000000']
         ]
-    }
+    })
 
     # Sample snaphost for trading pair ETHUSD with id = 27
-    SNAPSHOT_2 = {
+    SNAPSHOT_2 = _frozen_snapshot({
         'buy_price_levels': [
             ['181.95138', '0.69772000'],  # [price, amount]
             ['181.92711', '10.00000000'],
@@ -339,77 +349,73 @@ class FixtureLiquid:
             ['200000.60400', '0.01000001'],
             ['247000.00000', '0.10000000']
         ]
-    }
+    })
 
     # Sample buy action diff snapshot for trading pair LCXBTC with id = 538
-    DIFF_BUY_1 = json.dumps(
-        {
-            "channel": "price_ladders_cash_lcxbtc_buy",
-            "data": json.dumps(
-                [
-                    ["0.00000001", "1383755.33583919"]
-                ]
-            ),
-            "event": "updated"
-        }
-    )
+    DIFF_BUY_1 = {
+        "channel": "price_ladders_cash_lcxbtc_buy",
+        "data": ujson.dumps(
+            [
+                ["0.00000001", "1383755.33583919"]
+            ]
+        ),
+        "event": "updated"
+    }
 
     # Sample sell action diff snapshot for trading pair LCXBTC with id = 538
-    DIFF_SELL_1 = json.dumps(
-        {
-            "channel": "price_ladders_cash_lcxbtc_sell",
-            "data": json.dumps(
-                [
-                    ["0.00000003", "375928.38713356"],
-                    ["0.00000004", "350000.00000000"],
-                    ["0.00000006", "349178.00000000"],
-                    ["0.00000009", "353995.00000000"],
-                    ["0.00000010", "9500000.00000000"],
-                    ["0.00000011", "999990.00000000"],
-                    ["0.00000019", "141998.98597671"],
-                    ["0.00000022", "141998.98597671"],
-                    ["0.00000026", "2065.33260000"],
-                    ["0.00000044", "80591.90728052"],
-                    ["0.00000045", "1995.23960000"],
-                    ["0.00000047", "8888.00000000"],
-                    ["0.00000048", "3000000.00000000"],
-                    ["0.00000049", "870270.27283500"],
-                    ["0.00000099", "239533.71737500"],
-                    ["0.00000120", "300000.00000000"],
-                    ["0.00000159", "400000.00000000"],
-                    ["0.00000189", "509868.71330000"],
-                    ["0.00000239", "467777.00000000"],
-                    ["0.00000300", "915226.47257143"],
-                    ["0.00000333", "24000.00000000"],
-                    ["0.00000358", "1053936.00000000"],
-                    ["0.00000477", "1500000.00000000"],
-                    ["0.00000585", "2333.00000000"],
-                    ["0.00000586", "4666.00000000"],
-                    ["0.00000587", "3333.00000000"],
-                    ["0.00000590", "50000.00000000"],
-                    ["0.00000594", "1000000.00000000"],
-                    ["0.00000595", "72354.00000000"],
-                    ["0.00000596", "12323.00000000"],
-                    ["0.00000599", "20000.00000000"],
-                    ["0.00000600", "23222.00000000"],
-                    ["0.00000610", "23232.00000000"],
-                    ["0.00000620", "12555.00000000"],
-                    ["0.00000630", "37676.00000000"],
-                    ["0.00000640", "12455.00000000"],
-                    ["0.00000650", "19898.00000000"],
-                    ["0.00000660", "26665.00000000"],
-                    ["0.00000670", "29021.00000000"],
-                    ["0.00000680", "16642.00000000"]
-                ]
-            ),
-            "event": "updated"
-        }
-    )
+    DIFF_SELL_1 = {
+        "channel": "price_ladders_cash_lcxbtc_sell",
+        "data": ujson.dumps(
+            [
+                ["0.00000003", "375928.38713356"],
+                ["0.00000004", "350000.00000000"],
+                ["0.00000006", "349178.00000000"],
+                ["0.00000009", "353995.00000000"],
+                ["0.00000010", "9500000.00000000"],
+                ["0.00000011", "999990.00000000"],
+                ["0.00000019", "141998.98597671"],
+                ["0.00000022", "141998.98597671"],
+                ["0.00000026", "2065.33260000"],
+                ["0.00000044", "80591.90728052"],
+                ["0.00000045", "1995.23960000"],
+                ["0.00000047", "8888.00000000"],
+                ["0.00000048", "3000000.00000000"],
+                ["0.00000049", "870270.27283500"],
+                ["0.00000099", "239533.71737500"],
+                ["0.00000120", "300000.00000000"],
+                ["0.00000159", "400000.00000000"],
+                ["0.00000189", "509868.71330000"],
+                ["0.00000239", "467777.00000000"],
+                ["0.00000300", "915226.47257143"],
+                ["0.00000333", "24000.00000000"],
+                ["0.00000358", "1053936.00000000"],
+                ["0.00000477", "1500000.00000000"],
+                ["0.00000585", "2333.00000000"],
+                ["0.00000586", "4666.00000000"],
+                ["0.00000587", "3333.00000000"],
+                ["0.00000590", "50000.00000000"],
+                ["0.00000594", "1000000.00000000"],
+                ["0.00000595", "72354.00000000"],
+                ["0.00000596", "12323.00000000"],
+                ["0.00000599", "20000.00000000"],
+                ["0.00000600", "23222.00000000"],
+                ["0.00000610", "23232.00000000"],
+                ["0.00000620", "12555.00000000"],
+                ["0.00000630", "37676.00000000"],
+                ["0.00000640", "12455.00000000"],
+                ["0.00000650", "19898.00000000"],
+                ["0.00000660", "26665.00000000"],
+                ["0.00000670", "29021.00000000"],
+                ["0.00000680", "16642.00000000"]
+            ]
+        ),
+        "event": "updated"
+    }
 
     # Sample buy action diff snapshot for trading pair ETHUSD with id = 27
-    DIFF_BUY_2 = json.dumps({
+    DIFF_BUY_2 = {
         'channel': 'price_ladders_cash_ethusd_buy',
-        'data': json.dumps(
+        'data': ujson.dumps(
             [
                 ["184.81275", "1.24990000"],
                 ["184.61510", "3.24800000"],
@@ -454,80 +460,74 @@ class FixtureLiquid:
             ]
         ),
         'event': 'updated'
-    })
+    }
 
     # Sample sell action diff snapshot for trading pair ETHUSD with id = 27
-    DIFF_SELL_2 = json.dumps(
-        {
-            'channel': 'price_ladders_cash_ethusd_sell',
-            'data': json.dumps(
-                [
-                    ["184.86314", "19.71400000"],
-                    ["184.94590", "0.48700000"],
-                    ["184.94604", "16.99300000"],
-                    ["184.99744", "1.25000000"],
-                    ["184.99840", "0.49350000"],
-                    ["185.00861", "4.64960000"],
-                    ["185.13290", "0.16700000"],
-                    ["185.13300", "6.02540000"],
-                    ["185.20921", "1.01180000"],
-                    ["185.21568", "16.68150000"],
-                    ["185.27519", "0.52493193"],
-                    ["185.30093", "1.05529686"],
-                    ["185.32010", "0.17900000"],
-                    ["185.32025", "2.14700000"],
-                    ["185.32026", "31.47275456"],
-                    ["185.32035", "58.69600000"],
-                    ["185.62000", "0.33030000"],
-                    ["185.63980", "0.15400000"],
-                    ["185.67379", "11.29231000"],
-                    ["185.67452", "12.00000000"],
-                    ["185.67455", "38.16973000"],
-                    ["185.67456", "5.04200000"],
-                    ["185.82550", "0.15300000"],
-                    ["185.84188", "551.12750000"],
-                    ["185.86023", "2.50200000"],
-                    ["185.92867", "2.21200000"],
-                    ["186.04247", "188.00000000"],
-                    ["186.05247", "352.00000000"],
-                    ["186.05338", "37.50000000"],
-                    ["186.05447", "373.07824000"],
-                    ["186.12857", "2.18900000"],
-                    ["186.12858", "5.00000000"],
-                    ["186.14691", "10.00000000"],
-                    ["186.31470", "2.46700000"],
-                    ["186.40889", "4.25277422"],
-                    ["186.53451", "270.46800000"],
-                    ["186.67924", "183.08962000"],
-                    ["186.89400", "14.49633789"],
-                    ["187.00000", "10.00000000"],
-                    ["187.04556", "11.49633789"]
-                ]
-            ),
-            'event': 'updated'
-        }
-    )
+    DIFF_SELL_2 = {
+        'channel': 'price_ladders_cash_ethusd_sell',
+        'data': ujson.dumps(
+            [
+                ["184.86314", "19.71400000"],
+                ["184.94590", "0.48700000"],
+                ["184.94604", "16.99300000"],
+                ["184.99744", "1.25000000"],
+                ["184.99840", "0.49350000"],
+                ["185.00861", "4.64960000"],
+                ["185.13290", "0.16700000"],
+                ["185.13300", "6.02540000"],
+                ["185.20921", "1.01180000"],
+                ["185.21568", "16.68150000"],
+                ["185.27519", "0.52493193"],
+                ["185.30093", "1.05529686"],
+                ["185.32010", "0.17900000"],
+                ["185.32025", "2.14700000"],
+                ["185.32026", "31.47275456"],
+                ["185.32035", "58.69600000"],
+                ["185.62000", "0.33030000"],
+                ["185.63980", "0.15400000"],
+                ["185.67379", "11.29231000"],
+                ["185.67452", "12.00000000"],
+                ["185.67455", "38.16973000"],
+                ["185.67456", "5.04200000"],
+                ["185.82550", "0.15300000"],
+                ["185.84188", "551.12750000"],
+                ["185.86023", "2.50200000"],
+                ["185.92867", "2.21200000"],
+                ["186.04247", "188.00000000"],
+                ["186.05247", "352.00000000"],
+                ["186.05338", "37.50000000"],
+                ["186.05447", "373.07824000"],
+                ["186.12857", "2.18900000"],
+                ["186.12858", "5.00000000"],
+                ["186.14691", "10.00000000"],
+                ["186.31470", "2.46700000"],
+                ["186.40889", "4.25277422"],
+                ["186.53451", "270.46800000"],
+                ["186.67924", "183.08962000"],
+                ["186.89400", "14.49633789"],
+                ["187.00000", "10.00000000"],
+                ["187.04556", "11.49633789"]
+            ]
+        ),
+        'event': 'updated'
+    }
     # Sample response of successful subscription to a order book diff ws channel
-    WS_PUSHER_SUBSCRIPTION_SUCCESS_RESPONSE = json.dumps(
-        {
-            'channel': 'price_ladders_cash_lcxbtc_sell',
-            'data': json.dumps({}),
-            'event': 'pusher_internal:subscription_succeeded'
-        }
-    )
+    WS_PUSHER_SUBSCRIPTION_SUCCESS_RESPONSE = {
+        'channel': 'price_ladders_cash_lcxbtc_sell',
+        'data': ujson.dumps({}),
+        'event': 'pusher_internal:subscription_succeeded'
+    }
 
     # Sample response when socket client is successfully established
-    WS_CLIENT_CONNECTION_SUCCESS_RESPONSE = json.dumps(
-        {
-            'data': json.dumps(
-                {
-                    "activity_timeout": 120,
-                    "socket_id": "3000276318.8566049469"
-                }
-            ),
-            'event': 'pusher:connection_established'
-        }
-    )
+    WS_CLIENT_CONNECTION_SUCCESS_RESPONSE = {
+        'data': ujson.dumps(
+            {
+                "activity_timeout": 120,
+                "socket_id": "3000276318.8566049469"
+            }
+        ),
+        'event': 'pusher:connection_established'
+    }
 
     FIAT_ACCOUNTS = [
         {
@@ -762,3 +762,17 @@ class FixtureLiquid:
                 'executions': [], 'stop_triggered_time': None
             }
         ], 'total_pages': 10000, 'current_page': 1}
+
+    @classmethod
+    def as_json(cls, name: str) -> str:
+        """
+        Websocket fixtures are kept as dicts; this returns the raw string payload
+        the socket would deliver, serialized on first use and cached afterwards.
+        """
+        serialized = _SERIALIZED.get(name)
+        if serialized is None:
+            serialized = _SERIALIZED[name] = ujson.dumps(getattr(cls, name))
+        return serialized
+
+
+_SERIALIZED: Dict[str, str] = {}
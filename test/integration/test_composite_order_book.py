@@ -16,9 +16,13 @@ from hummingbot.core.clock import (
     ClockMode,
     Clock
 )
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.event.events import (
     MarketEvent,
     OrderFilledEvent,
+    OrderType,
+    TradeFee,
     TradeType,
 )
 from hummingbot.core.event.event_listener import EventListener
@@ -251,5 +255,27 @@ class CompositeOrderBookTest(unittest.TestCase):
         self.verify_composite_order_book_adjustment(self.market.get_order_book("WETH-DAI"))
 
 
+class CompositeOrderBookQueryTest(unittest.TestCase):
+    def setUp(self):
+        self.composite_ob = CompositeOrderBook()
+        self.composite_ob.apply_snapshot([OrderBookRow(99.0, 1.0, 1), OrderBookRow(98.0, 1.0, 1)],
+                                         [OrderBookRow(101.0, 1.0, 1), OrderBookRow(102.0, 1.0, 1)],
+                                         1)
+
+    def record_fill(self, trade_type: TradeType, price: float, amount: float):
+        self.composite_ob.record_filled_order(OrderFilledEvent(2, "order_id", "WETH-DAI", trade_type, OrderType.MARKET,
+                                                               price, amount, TradeFee(0)))
+
+    def test_get_price_for_volume_after_record_filled_order(self):
+        self.assertEqual(101.0, self.composite_ob.get_price_for_volume(True, 1.0).result_price)
+        self.assertEqual(99.0, self.composite_ob.get_price_for_volume(False, 1.0).result_price)
+
+        # Half of each top level has been consumed by paper fills, so the same volume now reaches the next level
+        self.record_fill(TradeType.BUY, 101.0, 0.5)
+        self.record_fill(TradeType.SELL, 99.0, 0.5)
+        self.assertEqual(102.0, self.composite_ob.get_price_for_volume(True, 1.0).result_price)
+        self.assertEqual(98.0, self.composite_ob.get_price_for_volume(False, 1.0).result_price)
+
+
 if __name__ == "__main__":
     unittest.main()
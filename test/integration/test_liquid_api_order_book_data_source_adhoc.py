@@ -1,9 +1,8 @@
 import asyncio
 import aiohttp
 import concurrent
-import inspect
 import pandas as pd
-from mock import patch
+from mock import AsyncMock, patch
 from unittest import TestCase
 
 from test.integration.assets.mock_data.fixture_liquid import FixtureLiquid
@@ -15,36 +14,54 @@ from hummingbot.connector.exchange.liquid.liquid_api_order_book_data_source impo
 
 PATCH_BASE_PATH = \
     'hummingbot.connector.exchange.liquid.liquid_api_order_book_data_source.LiquidAPIOrderBookDataSource.{method}'
+PATCH_PATHS = {
+    method: PATCH_BASE_PATH.format(method=method)
+    for method in ('get_exchange_markets_data', 'get_snapshot', 'get_trading_pairs', '_inner_messages')
+}
+
+
+async def _aiter(seq):
+    for item in seq:
+        yield item
 
 
 class TestLiquidAPIOrderBookDataSource(TestCase):
 
-    class AsyncIterator:
-        def __init__(self, seq):
-            self.iter = iter(seq)
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+        # Every test reading exchange markets data expects the same fixture, so install the patch once
+        cls._exchange_markets_data_patcher = patch(
+            PATCH_PATHS['get_exchange_markets_data'],
+            new_callable=AsyncMock,
+            return_value=FixtureLiquid.EXCHANGE_MARKETS_DATA
+        )
+        cls.mock_get_exchange_markets_data = cls._exchange_markets_data_patcher.start()
+        cls.client: aiohttp.ClientSession = cls.ev_loop.run_until_complete(cls.create_client())
+        # Output queue shared by the listener tests, drained after each test
+        cls.output_queue: asyncio.Queue = asyncio.Queue()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.client.close())
+        cls._exchange_markets_data_patcher.stop()
 
-        async def __aiter__(self):
-            return self
+    def tearDown(self):
+        while not self.output_queue.empty():
+            self.output_queue.get_nowait()
 
-        async def __anext__(self):
-            try:
-                return next(self.iter)
-            except StopIteration:
-                raise StopAsyncIteration
+    @staticmethod
+    async def create_client() -> aiohttp.ClientSession:
+        return aiohttp.ClientSession()
 
-    @patch(PATCH_BASE_PATH.format(method='get_exchange_markets_data'))
-    def test_get_active_exchange_markets(self, mock_get_exchange_markets_data):
+    def test_get_active_exchange_markets(self):
         """
         Test end to end flow from pinging Liquid API for markets and exchange data
         all the way to extract out needed information such as trading_pairs,
         prices, and volume information.
         """
-        loop = asyncio.get_event_loop()
-
-        # Mock Future() object return value as the request response
-        f = asyncio.Future()
-        f.set_result(FixtureLiquid.EXCHANGE_MARKETS_DATA)
-        mock_get_exchange_markets_data.return_value = f
+        loop = self.ev_loop
 
         all_markets_df = loop.run_until_complete(
             LiquidAPIOrderBookDataSource.get_active_exchange_markets())
@@ -163,18 +180,12 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
             ['WLOBTC', 'LCXBTC', 'STACETH', 'BTCUSDC', 'BTCUSD', 'ETHUSDC', 'ETHUSD']
         )
 
-    @patch(PATCH_BASE_PATH.format(method='get_exchange_markets_data'))
-    def test_get_trading_pairs(self, mock_get_exchange_markets_data):
+    def test_get_trading_pairs(self):
         """
         Test the logic where extracts trading pairs as well as the part
         trading_pair and id mapping is formed
         """
-        loop = asyncio.get_event_loop()
-
-        # Mock Future() object return value as the request response
-        f = asyncio.Future()
-        f.set_result(FixtureLiquid.EXCHANGE_MARKETS_DATA)
-        mock_get_exchange_markets_data.return_value = f
+        loop = self.ev_loop
 
         # Instantiate class instance
         liquid_data_source = LiquidAPIOrderBookDataSource()
@@ -200,18 +211,16 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
             }
         )
 
-    @patch('aiohttp.ClientResponse.json')
+    @patch('aiohttp.ClientResponse.json', new_callable=AsyncMock)
     def test_get_snapshot(self, mock_get):
         """
         To validate the response from aiohttp request contains the same payload
         as the final result
         """
-        loop = asyncio.get_event_loop()
+        loop = self.ev_loop
 
         # Mock aiohttp response
-        f = asyncio.Future()
-        f.set_result(FixtureLiquid.SNAPSHOT_1)
-        mock_get.return_value = f
+        mock_get.return_value = FixtureLiquid.SNAPSHOT_1
 
         # Instantiate class instance
         liquid_data_source = LiquidAPIOrderBookDataSource()
@@ -219,15 +228,15 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
         liquid_data_source.trading_pair_id_conversion_dict = {'BTC-ETH': 27}
 
         snapshot = loop.run_until_complete(
-            liquid_data_source.get_snapshot(client=aiohttp.ClientSession(), trading_pair='BTC-ETH', full=1))
+            liquid_data_source.get_snapshot(client=self.client, trading_pair='BTC-ETH', full=1))
 
         self.assertEqual(list(snapshot.keys()), ['buy_price_levels', 'sell_price_levels', 'trading_pair'])
         self.assertEqual(len(snapshot['buy_price_levels']), 2)
         self.assertEqual(len(snapshot['sell_price_levels']), 20)
         # TODO: need to test exception handling when inputs are invalid
 
-    @patch(PATCH_BASE_PATH.format(method='get_snapshot'))
-    @patch(PATCH_BASE_PATH.format(method='get_trading_pairs'))
+    @patch(PATCH_PATHS['get_snapshot'], new_callable=AsyncMock)
+    @patch(PATCH_PATHS['get_trading_pairs'], new_callable=AsyncMock)
     def test_get_tracking_pairs(self, mock_get_trading_pairs, mock_get_snapshot):
         """
         Example output of tracking pairs
@@ -249,21 +258,17 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
             )
         }
         """
-        loop = asyncio.get_event_loop()
+        loop = self.ev_loop
 
-        # Mock Future() object return value as the request response
+        # Mock the request response
         # For this particular test, the return value from get_snapshot is not relevant, therefore
-        # setting it with a random snapshot from fixture
-        f = asyncio.Future()
-        f.set_result(FixtureLiquid.SNAPSHOT_2)
-        mock_get_snapshot.return_value = f
+        # setting it with a random snapshot from fixture. The snapshot is copied per call since
+        # LiquidOrderBook merges metadata into it in place.
+        mock_get_snapshot.side_effect = lambda *args: dict(FixtureLiquid.SNAPSHOT_2)
 
         # Mock get trading pairs
         mocked_trading_pairs = ['BTC-USD', 'ETH-USDC', 'BTC-USDC']
-
-        f = asyncio.Future()
-        f.set_result(mocked_trading_pairs)
-        mock_get_trading_pairs.return_value = f
+        mock_get_trading_pairs.return_value = mocked_trading_pairs
 
         # Getting returned tracking pairs
         tracking_pairs = loop.run_until_complete(
@@ -284,8 +289,8 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
         for trading_pair, order_book_tracker_entry in zip(mocked_trading_pairs, tracking_pairs.values()):
             self.assertEqual(order_book_tracker_entry.trading_pair, trading_pair)
 
-    @patch(PATCH_BASE_PATH.format(method='get_snapshot'))
-    @patch(PATCH_BASE_PATH.format(method='get_trading_pairs'))
+    @patch(PATCH_PATHS['get_snapshot'], new_callable=AsyncMock)
+    @patch(PATCH_PATHS['get_trading_pairs'], new_callable=AsyncMock)
     def test_listen_for_order_book_snapshots(self, mock_get_trading_pairs, mock_get_snapshot):
         """
         Example order book message added to the queue:
@@ -304,45 +309,36 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
             },
             timestamp = 1573041256.2376761)
         """
-        loop = asyncio.get_event_loop()
+        loop = self.ev_loop
 
-        # Instantiate empty async queue and make sure the initial size is 0
-        q = asyncio.Queue()
+        # Make sure the shared async queue starts out empty
+        q = self.output_queue
         self.assertEqual(q.qsize(), 0)
 
-        # Mock Future() object return value as the request response
-        f1 = asyncio.Future()
-        f1.set_result(
+        # Mock the request responses
+        mock_get_snapshot.side_effect = [
             {
                 **FixtureLiquid.SNAPSHOT_2,
                 'trading_pair': 'ETH-USD',
                 'product_id': 27
-            }
-        )
-        f2 = asyncio.Future()
-        f2.set_result(
+            },
             {
                 **FixtureLiquid.SNAPSHOT_1,
                 'trading_pair': 'LCX-BTC',
                 'product_id': 538
             }
-        )
-
-        mock_get_snapshot.side_effect = [f1, f2]
+        ]
 
         # Mock get trading pairs
         mocked_trading_pairs = ['ETH-USD', 'LCX-BTC']
-
-        f = asyncio.Future()
-        f.set_result(mocked_trading_pairs)
-        mock_get_trading_pairs.return_value = f
+        mock_get_trading_pairs.return_value = mocked_trading_pairs
 
         # Listening for tracking pairs within the set timeout timeframe
         timeout = 6
 
         print('{class_name} test {test_name} is going to run for {timeout} seconds, starting now'.format(
             class_name=self.__class__.__name__,
-            test_name=inspect.stack()[0][3],
+            test_name=self._testMethodName,
             timeout=timeout))
 
         try:
@@ -377,28 +373,28 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
         self.assertEqual(first_item.content['trading_pair'], mocked_trading_pairs[0])
         self.assertEqual(first_item.content['product_id'], 27)
 
-    @patch(PATCH_BASE_PATH.format(method='_inner_messages'))
+    @patch(PATCH_PATHS['_inner_messages'])
     def test_listen_for_order_book_diffs(self, mock_inner_messages):
         timeout = 2
-        loop = asyncio.get_event_loop()
+        loop = self.ev_loop
 
-        q = asyncio.Queue()
+        q = self.output_queue
 
         #  Socket events receiving in the order from top to bottom
         mocked_socket_responses = [
-            FixtureLiquid.DIFF_BUY_1,
-            FixtureLiquid.DIFF_SELL_2,
-            FixtureLiquid.WS_PUSHER_SUBSCRIPTION_SUCCESS_RESPONSE,
-            FixtureLiquid.WS_CLIENT_CONNECTION_SUCCESS_RESPONSE,
-            FixtureLiquid.DIFF_BUY_2,
-            FixtureLiquid.DIFF_SELL_1
+            FixtureLiquid.as_json("DIFF_BUY_1"),
+            FixtureLiquid.as_json("DIFF_SELL_2"),
+            FixtureLiquid.as_json("WS_PUSHER_SUBSCRIPTION_SUCCESS_RESPONSE"),
+            FixtureLiquid.as_json("WS_CLIENT_CONNECTION_SUCCESS_RESPONSE"),
+            FixtureLiquid.as_json("DIFF_BUY_2"),
+            FixtureLiquid.as_json("DIFF_SELL_1")
         ]
 
-        mock_inner_messages.return_value = self.AsyncIterator(seq=mocked_socket_responses)
+        mock_inner_messages.return_value = _aiter(mocked_socket_responses)
 
         print('{class_name} test {test_name} is going to run for {timeout} seconds, starting now'.format(
             class_name=self.__class__.__name__,
-            test_name=inspect.stack()[0][3],
+            test_name=self._testMethodName,
             timeout=timeout))
 
         try:
@@ -419,12 +415,11 @@ class TestLiquidAPIOrderBookDataSource(TestCase):
 
         recv_events = [first_event, second_event, third_event, fourth_event]
 
-        for event in recv_events:
-            # Validate the data inject into async queue is in Liquid order book message type
-            self.assertIsInstance(event, LiquidOrderBookMessage)
+        # Validate the data inject into async queue is in Liquid order book message type
+        self.assertEqual({type(event) for event in recv_events}, {LiquidOrderBookMessage})
 
-            # Validate the event type is equal to DIFF
-            self.assertEqual(event.type, OrderBookMessageType.DIFF)
+        # Validate the event type is equal to DIFF
+        self.assertEqual([event.type for event in recv_events], [OrderBookMessageType.DIFF] * 4)
 
-            # Validate the actual content injected is dict type
-            self.assertIsInstance(event.content, dict)
+        # Validate the actual content injected is dict type
+        self.assertEqual({type(event.content) for event in recv_events}, {dict})
@@ -6,6 +6,7 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 import numpy as np
 
 
@@ -54,6 +55,50 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_ask, 0)
 
 
+class OrderBookApplyDiffsUnitTest(unittest.TestCase):
+    """
+    Diffs replacing an existing price level are re-inserted using the replaced level's successor as position hint
+    """
+    def setUp(self):
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(1, 1, 1), OrderBookRow(2, 1, 1), OrderBookRow(3, 1, 1)],
+                                       [OrderBookRow(4, 1, 1), OrderBookRow(5, 1, 1), OrderBookRow(6, 1, 1)],
+                                       1)
+
+    def bid_levels(self):
+        return [(row.price, row.amount) for row in self.order_book.bid_entries()]
+
+    def ask_levels(self):
+        return [(row.price, row.amount) for row in self.order_book.ask_entries()]
+
+    def test_replace_best_level(self):
+        self.order_book.apply_diffs([OrderBookRow(3, 2, 2)], [OrderBookRow(4, 2, 2)], 2)
+        self.assertEqual([(3, 2), (2, 1), (1, 1)], self.bid_levels())
+        self.assertEqual([(4, 2), (5, 1), (6, 1)], self.ask_levels())
+        self.assertEqual(3, self.order_book.get_price(False))
+        self.assertEqual(4, self.order_book.get_price(True))
+
+    def test_replace_middle_level(self):
+        self.order_book.apply_diffs([OrderBookRow(2, 2, 2)], [OrderBookRow(5, 2, 2)], 2)
+        self.assertEqual([(3, 1), (2, 2), (1, 1)], self.bid_levels())
+        self.assertEqual([(4, 1), (5, 2), (6, 1)], self.ask_levels())
+
+    def test_replace_last_level(self):
+        # The highest ask has no successor and is re-inserted with the end() hint, like the best bid above
+        self.order_book.apply_diffs([OrderBookRow(1, 2, 2)], [OrderBookRow(6, 2, 2)], 2)
+        self.assertEqual([(3, 1), (2, 1), (1, 2)], self.bid_levels())
+        self.assertEqual([(4, 1), (5, 1), (6, 2)], self.ask_levels())
+
+    def test_delete_level(self):
+        self.order_book.apply_diffs([OrderBookRow(3, 0, 2), OrderBookRow(1, 0, 2)],
+                                    [OrderBookRow(5, 0, 2), OrderBookRow(6, 0, 2)],
+                                    2)
+        self.assertEqual([(2, 1)], self.bid_levels())
+        self.assertEqual([(4, 1)], self.ask_levels())
+        self.assertEqual(2, self.order_book.get_price(False))
+        self.assertEqual(2, self.order_book.last_diff_uid)
+
+
 def main():
     logging.basicConfig(level=logging.INFO)
     unittest.main()